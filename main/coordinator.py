@@ -9,16 +9,33 @@ Orchestrates the workflow:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Set
 
 import yaml
 
 # Import from our local modules
-from main.utils.quay_image_checker import load_repo_config, search_by_date_range
+from main.utils.quay_image_checker import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_WORKERS,
+    configure_session,
+    load_repo_config,
+    search_by_date_range,
+)
 from main.utils.update_tekton_sc import TektonUpdater
 
+# Special cases where multiple services live in one repo
+_SERVICE_TO_REPO = {
+    # All notifications services live in notifications-backend
+    'notifications-aggregator': 'notifications-backend',
+    'notifications-connector-email': 'notifications-backend',
+    'notifications-engine-sc': 'notifications-backend',
+    'notifications-recipients-resolver': 'notifications-backend',
+}
+
 
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file."""
@@ -33,9 +50,17 @@ def load_config(config_path: str) -> dict:
         sys.exit(1)
 
 
-def check_stale_services(repos: dict, days: int, services: Optional[List[str]] = None) -> List[str]:
+def check_stale_services(
+    repos: dict,
+    days: int,
+    services: Optional[List[str]] = None,
+    workers: int = DEFAULT_WORKERS,
+    state_path: Optional[str] = None,
+    on_stale: Optional[Callable[[str], None]] = None
+) -> List[str]:
     """
     Check Quay repositories for stale services.
+    `on_stale` is called with each stale service as soon as it is found.
     Returns list of service names without recent images.
     """
     print("=" * 80)
@@ -56,7 +81,10 @@ def check_stale_services(repos: dict, days: int, services: Optional[List[str]] =
         start_date_str,
         end_date_str,
         services,
-        report_mode=True
+        report_mode=True,
+        workers=workers,
+        state_path=state_path,
+        on_stale=on_stale
     )
 
     return stale_services
@@ -67,26 +95,52 @@ def map_service_to_repo(service_name: str) -> str:
     Map service name to git repository name.
     Some services share the same git repository.
     """
-    # Special cases where multiple services live in one repo
-    service_to_repo = {
-        # All notifications services live in notifications-backend
-        'notifications-aggregator': 'notifications-backend',
-        'notifications-connector-email': 'notifications-backend',
-        'notifications-engine-sc': 'notifications-backend',
-        'notifications-recipients-resolver': 'notifications-backend',
-    }
+    return _SERVICE_TO_REPO.get(service_name, service_name)
+
+
+class RepoPrefetcher:
+    """
+    Fetch stale services' repositories from upstream in the background, so
+    git network work overlaps with the rest of the Quay check.
+    """
+
+    def __init__(self, git_repos_dir: str, max_workers: int = 4):
+        self.updater = TektonUpdater(parent_dir=git_repos_dir)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.submitted = set()
+        self.futures = {}  # repo_name -> future of its fetch
 
-    return service_to_repo.get(service_name, service_name)
+    def submit(self, service_name: str) -> None:
+        """Start fetching the repository for a stale service, once per repository."""
+        repo_name = map_service_to_repo(service_name)
+        if repo_name in self.submitted:
+            return
+        self.submitted.add(repo_name)
+
+        repo_path = self.updater.parent_dir / repo_name
+        if self.updater.is_git_repo(repo_path):
+            self.futures[repo_name] = self.executor.submit(self.updater.fetch_upstream, repo_path)
+
+    def wait(self) -> Set[str]:
+        """Wait for all started fetches to finish and return the repositories fetched successfully."""
+        self.executor.shutdown(wait=True)
+        return {
+            repo_name for repo_name, future in self.futures.items()
+            if future.exception() is None and future.result()[0]
+        }
 
 
 def update_stale_repos(
     stale_services: List[str],
     git_repos_dir: str,
     branch: str = "security-compliance",
-    dry_run: bool = False
+    dry_run: bool = False,
+    prefetched: Optional[Set[str]] = None
 ) -> None:
     """
     Update Tekton SC files in stale service repositories.
+    Repositories in `prefetched` were already fetched from upstream this run
+    and are not fetched again.
     """
     if not stale_services:
         print("\n" + "=" * 80)
@@ -105,7 +159,7 @@ def update_stale_repos(
 
     # Map service names to git repository names
     # Some services may share the same repo (e.g., notifications)
-    repo_names = sorted(set([map_service_to_repo(svc) for svc in stale_services]))
+    repo_names = sorted({map_service_to_repo(svc) for svc in stale_services})
 
     if len(repo_names) < len(stale_services):
         print(f"Note: {len(stale_services)} services map to {len(repo_names)} repositories (some share repos)\n")
@@ -115,7 +169,8 @@ def update_stale_repos(
         parent_dir=git_repos_dir,
         branch=branch,
         specific_repos=repo_names,
-        dry_run=dry_run
+        dry_run=dry_run,
+        prefetched=prefetched
     )
 
     # Run the update process
@@ -169,6 +224,26 @@ Examples:
         help='Only check for stale services, do not update repositories'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help=f'Number of Quay repositories to check concurrently (overrides config, default: {DEFAULT_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the on-disk Quay response cache'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        metavar='SECONDS',
+        help=f'Seconds before cached Quay responses are revalidated; page 1 always is (default: {DEFAULT_CACHE_TTL})'
+    )
+
     args = parser.parse_args()
 
     # Load configuration
@@ -177,6 +252,13 @@ Examples:
     # Override config with command line arguments
     dry_run = args.dry_run or config.get('dry_run', False)
     services = args.services or config.get('services') or None
+    workers = args.workers or config.get('quick_search_workers', DEFAULT_WORKERS)
+
+    configure_session(
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl,
+        rate_limit=config.get('rate_limit_rps', DEFAULT_RATE_LIMIT)
+    )
 
     # Load repository configuration
     repos_config_path = config.get('repos_config', 'repos.json')
@@ -188,11 +270,20 @@ Examples:
 
     print(f"Loaded {len(repos)} repository configuration(s)")
 
+    # Start fetching stale repos while the Quay check is still running
+    git_repos_dir = config.get('git_repos_dir')
+    prefetcher = None
+    if not args.check_only and git_repos_dir:
+        prefetcher = RepoPrefetcher(git_repos_dir)
+
     # Step 1: Check for stale services
     stale_services = check_stale_services(
         repos,
         config.get('quick_search_days', 14),
-        services
+        services,
+        workers,
+        config.get('state_path'),
+        prefetcher.submit if prefetcher else None
     )
 
     # If check-only mode, stop here
@@ -202,9 +293,10 @@ Examples:
         print("=" * 80)
         sys.exit(0)
 
+    prefetched = prefetcher.wait() if prefetcher else set()
+
     # Step 2: Update stale repositories
     if stale_services:
-        git_repos_dir = config.get('git_repos_dir')
         if not git_repos_dir:
             print("\nError: git_repos_dir not configured in config file", file=sys.stderr)
             sys.exit(1)
@@ -213,7 +305,8 @@ Examples:
             stale_services,
             git_repos_dir,
             config.get('branch', 'security-compliance'),
-            dry_run
+            dry_run,
+            prefetched
         )
 
     print("\n" + "=" * 80)
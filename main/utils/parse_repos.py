@@ -2,6 +2,7 @@
 """Parse Konflux service references markdown and create repos.json"""
 
 import argparse
+import itertools
 import json
 import re
 import sys
@@ -12,44 +13,30 @@ try:
 except ImportError:
     yaml = None
 
-def extract_quay_url(markdown_line):
-    """Extract Quay.io URL from markdown link format"""
-    # Pattern: [quay.io](https://quay.io/repository/...)
-    match = re.search(r'\[quay\.io\]\((https://quay\.io/repository/[^)]+)\)', markdown_line)
-    if match:
-        full_url = match.group(1)
-        # Extract path after /repository/
-        # https://quay.io/repository/redhat-services-prod/tenant/app/component
-        # -> quay.io/redhat-services-prod/tenant/app/component
-        repo_path = full_url.replace('https://quay.io/repository/', 'quay.io/')
-        return repo_path
-    return None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Table row whose second column links to Quay: | Service Name | [quay.io](...) | ... |
+_ROW_RE = re.compile(r'\s*\|\s*([^|]*?)\s*\|[^|]*?\[quay\.io\]\(https://quay\.io/repository/([^)|]+)\)')
 
 def parse_markdown_table(md_file_path):
     """Parse the markdown table and extract service -> repo mappings"""
     repos = {}
+    match_row = _ROW_RE.match
 
     with open(md_file_path, 'r') as f:
-        lines = f.readlines()
-
-    # Skip header lines (first 8 lines based on the file structure)
-    for line in lines[8:]:
-        line = line.strip()
-
-        # Skip empty lines and separator lines
-        if not line or line.startswith('##') or '|---' in line:
-            continue
-
-        # Parse table row: | Service Name | [quay.io](...) | ... |
-        if line.startswith('|'):
-            parts = [p.strip() for p in line.split('|')]
-            if len(parts) >= 3:
-                service_name = parts[1]
-                quay_column = parts[2]
+        # Skip header lines (first 8 lines based on the file structure)
+        for line in itertools.islice(f, 8, None):
+            # One match captures the service name and the repo path after /repository/
+            match = match_row(line)
+            if not match:
+                continue
 
-                quay_url = extract_quay_url(quay_column)
-                if service_name and quay_url:
-                    repos[service_name] = quay_url
+            service_name = match.group(1)
+            if service_name:
+                repos[service_name] = 'quay.io/' + match.group(2)
 
     return repos
 
@@ -127,8 +114,12 @@ Examples:
     print(f"Found {len(repos)} services")
 
     # Write to JSON file
-    with open(output_file, 'w') as f:
-        json.dump(repos, f, indent=2, sort_keys=True)
+    if orjson:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(repos, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(repos, f, indent=2, sort_keys=True)
 
     print(f"Created {output_file}")
 
@@ -5,18 +5,175 @@ Quay Image Checker - Search for images in Quay repositories by SHA or date range
 
 import argparse
 import json
+import os
+import re
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import urllib.request
-import urllib.error
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, List, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer orjson's faster parser when available; both accept bytes
+_json_loads = orjson.loads if orjson else json.loads
+
+# Default number of repositories fetched concurrently
+DEFAULT_WORKERS = 8
+
+# Default number of tag pages fetched concurrently per repository
+DEFAULT_PAGE_BATCH = 4
+
+# sc-{YYYYMMDD}-{sha} image tags
+_SC_RE = re.compile(r'^sc-(?P<date>\d{8})-')
+
+# Extra pages scanned after the date window ends, for out-of-order pushes
+PAGINATION_SLACK_PAGES = 1
+
+# Seconds to wait on a single Quay API request
+REQUEST_TIMEOUT = 10
+
+# Connections kept alive to quay.io; also bounds concurrent page fetches
+HTTP_POOL_SIZE = 32
+
+# On-disk response cache (requires requests-cache)
+CACHE_NAME = '.quay_cache'
+DEFAULT_CACHE_TTL = 3600
+# Page 1 holds the newest tags, which decide staleness, so it is revalidated
+# on every request (a cheap 304 when unchanged) instead of served from cache
+FIRST_PAGE_CACHE_TTL = 0
+
+# Requests per second sent to Quay (0 disables rate limiting)
+DEFAULT_RATE_LIMIT = 20
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second on average."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        # Hold at least one token, or rates below 1/s could never acquire
+        self.capacity = max(1.0, capacity or rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                self._condition.wait((1 - self._tokens) / self.rate)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from a TokenBucket before each request goes out."""
+
+    def __init__(self, bucket: Optional[TokenBucket] = None, **kwargs):
+        self.bucket = bucket
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if self.bucket:
+            self.bucket.acquire()
+        return super().send(request, **kwargs)
+
+
+def _build_session(use_cache: bool = False, cache_ttl: int = DEFAULT_CACHE_TTL,
+                   rate_limit: float = DEFAULT_RATE_LIMIT) -> requests.Session:
+    """
+    Create the HTTP session shared by all Quay API requests.
+    Connections to quay.io are kept alive and reused across pages and repos,
+    requests are limited to `rate_limit` per second, and transient failures
+    (including 429s, honoring Retry-After) are retried with backoff. When
+    caching is enabled and requests-cache is installed, responses are stored
+    in a local SQLite cache and revalidated with their ETag/Last-Modified once
+    `cache_ttl` seconds have passed (page 1 on every request, see
+    get_quay_tags); cache hits are not rate limited.
+    """
+    if use_cache and requests_cache:
+        session = requests_cache.CachedSession(
+            cache_name=CACHE_NAME,
+            backend='sqlite',
+            expire_after=cache_ttl
+        )
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+    # Every namespace lives on quay.io, so one host pool serves all repos.
+    # Blocking when it is exhausted makes callers wait for a kept-alive
+    # connection rather than opening (and then discarding) extra ones.
+    adapter = _RateLimitedAdapter(
+        bucket=TokenBucket(rate_limit) if rate_limit > 0 else None,
+        pool_connections=1,
+        pool_maxsize=HTTP_POOL_SIZE,
+        pool_block=True,
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def configure_session(use_cache: bool = True, cache_ttl: int = DEFAULT_CACHE_TTL,
+                      rate_limit: float = DEFAULT_RATE_LIMIT) -> None:
+    """Rebuild the shared HTTP session with the given cache and rate limit settings."""
+    global _SESSION
+    if use_cache and not requests_cache:
+        print("Warning: requests-cache not installed, Quay responses will not be cached", file=sys.stderr)
+    _SESSION = _build_session(use_cache, cache_ttl, rate_limit)
+
+
+_FETCH_EXECUTOR = None
+_FETCH_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool shared by all page fetches, creating it on first use.
+    Reusing one pool avoids spinning up threads for every repository.
+    """
+    global _FETCH_EXECUTOR
+    with _FETCH_EXECUTOR_LOCK:
+        if _FETCH_EXECUTOR is None:
+            _FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix='quay-fetch')
+        return _FETCH_EXECUTOR
 
 
 def load_repo_config(config_path: str) -> Dict[str, str]:
     """Load repository configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: Config file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
@@ -40,50 +197,87 @@ def parse_quay_repo(repo_url: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def get_quay_tags(namespace: str, repository: str, page: int = 1, page_size: int = 100) -> Dict:
+def get_quay_tags(namespace: str, repository: str, page: int = 1, page_size: int = 100,
+                  tag_filter: Optional[str] = None) -> Dict:
     """
-    Fetch tags from Quay repository using public API.
+    Fetch active tags from Quay repository using public API.
+    `tag_filter` is passed as Quay's filter_tag_name (e.g. 'like:sc-').
     Returns the JSON response containing tags.
     """
-    url = f"https://quay.io/api/v1/repository/{namespace}/{repository}/tag/?page={page}&limit={page_size}"
+    url = f"https://quay.io/api/v1/repository/{namespace}/{repository}/tag/"
+    params = {'page': page, 'limit': page_size, 'onlyActiveTags': 'true'}
+    if tag_filter:
+        params['filter_tag_name'] = tag_filter
+
+    # Never trust a cached copy of the newest page without revalidating it
+    cache_kwargs = {}
+    if page == 1 and requests_cache and isinstance(_SESSION, requests_cache.CachedSession):
+        cache_kwargs['expire_after'] = FIRST_PAGE_CACHE_TTL
 
     try:
-        with urllib.request.urlopen(url) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+        response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT, **cache_kwargs)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    except requests.HTTPError as e:
+        status_code = e.response.status_code
+        if status_code == 404:
             print(f"Error: Repository {namespace}/{repository} not found or not public", file=sys.stderr)
         else:
-            print(f"Error: HTTP {e.code} fetching tags from {namespace}/{repository}", file=sys.stderr)
+            print(f"Error: HTTP {status_code} fetching tags from {namespace}/{repository}", file=sys.stderr)
         return None
     except Exception as e:
         print(f"Error fetching tags: {e}", file=sys.stderr)
         return None
 
 
-def get_all_tags(namespace: str, repository: str) -> List[Dict]:
-    """Fetch all tags from a Quay repository, handling pagination."""
-    all_tags = []
+def _iter_tag_pages(namespace: str, repository: str, page_batch: int = DEFAULT_PAGE_BATCH,
+                    tag_filter: Optional[str] = None) -> Iterator[List[Dict]]:
+    """
+    Yield each page of tags from a Quay repository, in page order.
+    The first page is fetched on its own, since callers often stop there;
+    later pages are requested `page_batch` at a time in parallel on the shared
+    fetch pool, and any pages fetched past the last one are discarded.
+    An empty page is only ever yielded last. Stops early on a failed request.
+    """
     page = 1
+    batch = 1
+    executor = _get_fetch_executor()
 
     while True:
-        response = get_quay_tags(namespace, repository, page=page)
-        if not response or 'tags' not in response:
-            break
+        # map() yields responses in page order regardless of completion order
+        responses = executor.map(
+            lambda p: get_quay_tags(namespace, repository, page=p, tag_filter=tag_filter),
+            range(page, page + batch)
+        )
 
-        tags = response['tags']
-        if not tags:
-            break
+        for response in responses:
+            if not response or 'tags' not in response:
+                return
 
-        all_tags.extend(tags)
+            tags = response['tags']
+            yield tags
+
+            # Check if there are more pages
+            if not tags or not response.get('has_additional', False):
+                return
+
+        page += batch
+        batch = max(1, page_batch)
 
-        # Check if there are more pages
-        if not response.get('has_additional', False):
-            break
 
-        page += 1
+def _tag_timestamp(tag: Dict) -> Optional[float]:
+    """Return when a tag was last pushed as a Unix timestamp, if Quay reports it."""
+    if 'start_ts' in tag:
+        return tag['start_ts']
 
-    return all_tags
+    last_modified = tag.get('last_modified')
+    if not last_modified:
+        return None
+
+    try:
+        return parsedate_to_datetime(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return None
 
 
 def is_sha_tag(tag_name: str, sha: str) -> bool:
@@ -91,37 +285,148 @@ def is_sha_tag(tag_name: str, sha: str) -> bool:
     return tag_name == sha or tag_name.endswith(f"-{sha}")
 
 
-def is_sc_tag_in_range(tag_name: str, start_date: Optional[str], end_date: Optional[str]) -> tuple[bool, Optional[str]]:
+def _make_matcher(start_date: Optional[str], end_date: Optional[str]) -> Callable[[str], tuple[bool, Optional[str]]]:
     """
-    Check if tag matches sc-{YYYYMMDD}-{sha} pattern and falls within date range.
-    Returns (matches, date_string)
+    Build a check that a tag matches sc-{YYYYMMDD}-{sha} within the date range.
+    The matcher returns (matches, date_string).
+    Bounds are converted to YYYYMMDD integers up front and missing bounds become
+    sentinels, so each tag needs a single integer range comparison.
     """
-    if not tag_name.startswith('sc-'):
-        return False, None
+    lower = int(start_date) if start_date else 0
+    upper = int(end_date) if end_date else 99999999
+    match_sc = _SC_RE.match
+
+    def matcher(tag_name: str) -> tuple[bool, Optional[str]]:
+        match = match_sc(tag_name)
+        if not match:
+            return False, None
+
+        date_str = match['date']
+        return lower <= int(date_str) <= upper, date_str
+
+    return matcher
 
-    parts = tag_name.split('-')
-    if len(parts) < 3:
-        return False, None
 
-    date_str = parts[1]
+def _state_entry_covers(entry: Dict, top_tag: Optional[str], start_date: Optional[str]) -> bool:
+    """Check whether a saved result is still valid for a repository's newest tag and start date."""
+    if 'matches' not in entry or entry.get('top_tag') != top_tag:
+        return False
 
-    # Validate date format (YYYYMMDD)
-    if len(date_str) != 8 or not date_str.isdigit():
-        return False, None
+    # Saved matches only reach back to the start date they were collected with
+    saved_start = entry.get('start_date')
+    return saved_start is None or (start_date is not None and saved_start <= start_date)
 
-    # Check date range if provided
-    if start_date and date_str < start_date:
-        return False, date_str
-    if end_date and date_str > end_date:
-        return False, date_str
 
-    return True, date_str
+def search_repository(namespace: str, repository: str, start_date: Optional[str], end_date: Optional[str],
+                      page_batch: int = DEFAULT_PAGE_BATCH,
+                      state_entry: Optional[Dict] = None) -> Optional[List[tuple[Dict, str]]]:
+    """
+    Scan a repository's tags for sc-{date}-{sha} images within date range.
+    Only sc- tags are requested, and Quay lists them newest first, so pagination
+    stops once a whole page was pushed before start_date (plus
+    PAGINATION_SLACK_PAGES extra pages).
+    If `state_entry` holds a previous run's result and the newest sc- tag is
+    unchanged, that result is reused after the first page; the entry is then
+    updated in place with this run's result.
+    Returns list of (tag, date_string) matches, or None if the repository
+    could not be read.
+    """
+    # Allow a day of slack between the tag's date and its push time
+    cutoff = None
+    if start_date:
+        cutoff = datetime.strptime(start_date, '%Y%m%d').timestamp() - 86400
+
+    responded = False
+    top_tag = None
+    pages_past_window = 0
+    # Collected without the end date so a saved result stays valid as the window moves
+    matches = []
+    add_match = matches.append
+    in_range = _make_matcher(start_date, None)
+    tag_timestamp = _tag_timestamp
+
+    for tags in _iter_tag_pages(namespace, repository, page_batch, tag_filter='like:sc-'):
+        if not responded:
+            responded = True
+            top_tag = tags[0]['name'] if tags else None
+
+            if state_entry is not None and _state_entry_covers(state_entry, top_tag, start_date):
+                matches = [
+                    (tag, date_str) for tag, date_str in state_entry['matches']
+                    if not start_date or date_str >= start_date
+                ]
+                break
+
+        # Match tags and check the page against the cutoff in a single pass
+        past_window = cutoff is not None and bool(tags)
+        for tag in tags:
+            is_match, date_str = in_range(tag['name'])
+            if is_match:
+                add_match((tag, date_str))
+
+            if past_window:
+                pushed = tag_timestamp(tag)
+                if pushed is None or pushed >= cutoff:
+                    past_window = False
+
+        if not past_window:
+            pages_past_window = 0
+            continue
+
+        pages_past_window += 1
+        if pages_past_window > PAGINATION_SLACK_PAGES:
+            break
+
+    if not responded:
+        return None
+
+    if state_entry is not None:
+        state_entry.update(top_tag=top_tag, start_date=start_date, matches=matches)
+
+    return [(tag, date_str) for tag, date_str in matches if not end_date or date_str <= end_date]
+
+
+def load_state(state_path: str) -> Dict[str, Dict]:
+    """Load saved per-service results from a previous run, if any."""
+    try:
+        with open(state_path, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable state file {state_path}: {e}", file=sys.stderr)
+        return {}
+
+
+def save_state(state_path: str, state: Dict[str, Dict]) -> None:
+    """Atomically write per-service results for the next run."""
+    directory = os.path.dirname(os.path.abspath(state_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.quay_state.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, state_path)
+    except OSError as e:
+        print(f"Warning: Failed to write state file {state_path}: {e}", file=sys.stderr)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def search_by_date_range(repos: Dict[str, str], start_date: Optional[str], end_date: Optional[str],
-                         services: Optional[List[str]] = None, report_mode: bool = False):
+                         services: Optional[List[str]] = None, report_mode: bool = False,
+                         workers: int = DEFAULT_WORKERS, page_batch: int = DEFAULT_PAGE_BATCH,
+                         state_path: Optional[str] = None,
+                         on_stale: Optional[Callable[[str], None]] = None):
     """
     Search repositories for sc-{date}-{sha} images within date range.
+    Tags for each service are fetched concurrently using up to `workers` threads,
+    with up to `page_batch` pages per service requested at once.
+    If `state_path` is given, results are saved there and reused on the next
+    run for services whose newest sc- tag has not changed.
+    `on_stale` is called with each service name as soon as it is found to
+    have no updates, so callers can start follow-up work early.
     Returns tuple: (found_any, repos_without_updates)
     """
     found_any = False
@@ -131,86 +436,110 @@ def search_by_date_range(repos: Dict[str, str], start_date: Optional[str], end_d
     repos_without_updates = []
     repos_with_errors = []
 
-    total_services = len([s for s in repos.keys() if not services or s in services])
-    current = 0
+    date_range_str = ""
+    if start_date and end_date:
+        date_range_str = f" ({start_date} to {end_date})"
+    elif start_date:
+        date_range_str = f" (from {start_date})"
+    elif end_date:
+        date_range_str = f" (until {end_date})"
 
+    # Resolve every repo up front so only valid ones are scheduled
+    targets = []
     for service, repo_url in repos.items():
         if services and service not in services:
             continue
 
-        current += 1
-
         try:
             namespace, repository = parse_quay_repo(repo_url)
         except ValueError as e:
             repos_with_errors.append((service, f"Invalid repo format: {e}"))
             if not report_mode:
-                print(f"[{current}/{total_services}] Skipping {service}: {e}", file=sys.stderr)
+                print(f"Skipping {service}: {e}", file=sys.stderr)
             continue
 
-        date_range_str = ""
-        if start_date and end_date:
-            date_range_str = f" ({start_date} to {end_date})"
-        elif start_date:
-            date_range_str = f" (from {start_date})"
-        elif end_date:
-            date_range_str = f" (until {end_date})"
+        targets.append((service, namespace, repository))
 
-        if not report_mode:
-            print(f"\n[{current}/{total_services}] Searching {service} ({namespace}/{repository}){date_range_str}...")
+    total_services = len(targets)
+    current = 0
 
-        tags = get_all_tags(namespace, repository)
+    # Each service's entry is only touched by the thread scanning it
+    state = load_state(state_path) if state_path else {}
 
-        if not tags:
-            repos_with_errors.append((service, "No tags found or error accessing repository"))
-            if not report_mode:
-                print(f"  No tags found or error accessing repository")
-            continue
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(
+                search_repository, namespace, repository, start_date, end_date, page_batch,
+                state.setdefault(service, {}) if state_path else None
+            ): (service, namespace, repository)
+            for service, namespace, repository in targets
+        }
 
-        matches = []
-        for tag in tags:
-            is_match, date_str = is_sc_tag_in_range(tag['name'], start_date, end_date)
-            if is_match:
-                matches.append((tag, date_str))
+        # Results are classified in the main thread as they complete
+        for future in as_completed(futures):
+            service, namespace, repository = futures[future]
+            current += 1
 
-        if matches:
-            found_any = True
-            repos_with_updates.append((service, matches))
             if not report_mode:
-                print(f"  ✓ Found {len(matches)} match(es):")
-                for tag, date_str in matches:
-                    manifest_digest = tag.get('manifest_digest', 'N/A')
-                    print(f"    - {tag['name']} (date: {date_str}, digest: {manifest_digest[:19]}...)")
-        else:
-            repos_without_updates.append(service)
-            if not report_mode:
-                print(f"  ✗ No matches found")
-
-    # Print report if in report mode
+                print(f"\n[{current}/{total_services}] Searched {service} ({namespace}/{repository}){date_range_str}")
+
+            matches = future.result()
+
+            if matches is None:
+                repos_with_errors.append((service, "Error accessing repository"))
+                if not report_mode:
+                    print(f"  Error accessing repository")
+                continue
+
+            if matches:
+                found_any = True
+                repos_with_updates.append((service, matches))
+                if not report_mode:
+                    print(f"  ✓ Found {len(matches)} match(es):")
+                    for tag, date_str in matches:
+                        manifest_digest = tag.get('manifest_digest', 'N/A')
+                        print(f"    - {tag['name']} (date: {date_str}, digest: {manifest_digest[:19]}...)")
+            else:
+                repos_without_updates.append(service)
+                if on_stale:
+                    on_stale(service)
+                if not report_mode:
+                    print(f"  ✗ No matches found")
+
+    # Completion order is nondeterministic; keep the returned list stable
+    repos_without_updates.sort()
+
+    if state_path:
+        save_state(state_path, {service: entry for service, entry in state.items() if entry})
+
+    # Print report if in report mode, written to stdout in a single call
     if report_mode:
-        print("\n" + "="*80)
-        print("REPOSITORY UPDATE REPORT")
-        print("="*80)
+        out = []
+        out.append("\n" + "="*80)
+        out.append("REPOSITORY UPDATE REPORT")
+        out.append("="*80)
 
-        print(f"\n✓ REPOSITORIES WITH UPDATES ({len(repos_with_updates)}):")
-        print("-" * 80)
+        out.append(f"\n✓ REPOSITORIES WITH UPDATES ({len(repos_with_updates)}):")
+        out.append("-" * 80)
         for service, matches in sorted(repos_with_updates):
             latest = matches[0]  # First match
-            print(f"  {service:<40} {latest[0]['name']}")
+            out.append(f"  {service:<40} {latest[0]['name']}")
 
-        print(f"\n✗ REPOSITORIES WITHOUT UPDATES ({len(repos_without_updates)}):")
-        print("-" * 80)
+        out.append(f"\n✗ REPOSITORIES WITHOUT UPDATES ({len(repos_without_updates)}):")
+        out.append("-" * 80)
         for service in sorted(repos_without_updates):
-            print(f"  {service}")
+            out.append(f"  {service}")
 
-        print(f"\n⚠ REPOSITORIES WITH ERRORS ({len(repos_with_errors)}):")
-        print("-" * 80)
+        out.append(f"\n⚠ REPOSITORIES WITH ERRORS ({len(repos_with_errors)}):")
+        out.append("-" * 80)
         for service, error in sorted(repos_with_errors):
-            print(f"  {service:<40} {error}")
+            out.append(f"  {service:<40} {error}")
 
-        print("\n" + "="*80)
-        print(f"SUMMARY: {len(repos_with_updates)} updated, {len(repos_without_updates)} not updated, {len(repos_with_errors)} errors")
-        print("="*80)
+        out.append("\n" + "="*80)
+        out.append(f"SUMMARY: {len(repos_with_updates)} updated, {len(repos_without_updates)} not updated, {len(repos_with_errors)} errors")
+        out.append("="*80)
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     return found_any, repos_without_updates
 
@@ -259,12 +588,43 @@ Examples:
         help='Output services without updates to a file (one per line)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of repositories to check concurrently (default: {DEFAULT_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the on-disk Quay response cache'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        metavar='SECONDS',
+        help=f'Seconds before cached Quay responses are revalidated; page 1 always is (default: {DEFAULT_CACHE_TTL})'
+    )
+
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=DEFAULT_RATE_LIMIT,
+        metavar='RPS',
+        help=f'Maximum Quay API requests per second, 0 for no limit (default: {DEFAULT_RATE_LIMIT})'
+    )
+
     args = parser.parse_args()
 
     
     if not args.quick:
         parser.error("Must specify --quick mode")
 
+    configure_session(use_cache=not args.no_cache, cache_ttl=args.cache_ttl, rate_limit=args.rate_limit)
+
     # Load repository configuration
     repos = load_repo_config(args.config)
 
@@ -283,7 +643,8 @@ Examples:
         end_date_str = end_date.strftime('%Y%m%d')
         print(f"Quick mode: Searching for images from last 14 days ({start_date_str} to {end_date_str})\n")
 
-        found, stale_services = search_by_date_range(repos, start_date_str, end_date_str, args.services, report_mode=True)
+        found, stale_services = search_by_date_range(repos, start_date_str, end_date_str, args.services,
+                                                     report_mode=True, workers=args.workers)
 
         # Write stale services to file if requested
         if args.output_stale and stale_services: